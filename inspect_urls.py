@@ -1,14 +1,55 @@
 import os
+import csv
 import json
 import time
-from datetime import datetime, timedelta
+import random
+import logging
+import sqlite3
+import asyncio
+import itertools
+import threading
+from datetime import datetime, timedelta, timezone
+import httpx
+import orjson
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 import google.auth
+import google.auth.crypt
+import google.auth.transport.requests
+
+log = logging.getLogger(__name__)
+
+def positive_env(name, default, cast):
+    value = cast(os.environ.get(name, default))
+    if value <= 0:
+        raise ValueError(f"{name} must be positive, got {value}")
+    return value
 
 # Configuration
 SITE_URL = "https://wordsolverx.com/"
 PAGES_FILE = "pages.txt"
+INSPECT_ENDPOINT = "https://searchconsole.googleapis.com/v1/urlInspection/index:inspect"
+INSPECT_FIELDS = "inspectionResult/indexStatusResult"  # Only part of the response we read
+MAX_CONCURRENCY = positive_env('MAX_CONCURRENCY', '5', int)
+MAX_QPS = positive_env('MAX_QPS', '10', float)  # URL Inspection allows ~600 requests/min
+MAX_RETRIES = 5
+MAX_RETRY_DELAY = 60  # Seconds
+REQUEST_TIMEOUT = 60  # Seconds; inspections can be slow, well past httpx's 5s default
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+CACHE_DIR = os.path.expanduser('~/.cache/gsc')
+TOKEN_CACHE_FILE = os.path.join(CACHE_DIR, 'token.json')
+TOKEN_MIN_LIFETIME = timedelta(minutes=15)  # The token is baked into the inspection client for the whole run
+SITE_URL_CACHE_FILE = os.path.join(CACHE_DIR, 'site_url.json')
+SITE_URL_CACHE_MAX_AGE = 7 * 24 * 3600  # Re-verify the GSC property weekly
+INSPECTION_CACHE_DB = '.gsc_cache.db'
+INSPECTION_CACHE_MAX_AGE = 24 * 3600  # Google re-crawls slowly, so a day-old result is still useful
+SHEETS_APPEND_CHUNK = 500  # Rows per values.append call; one call covers a normal daily run
+
+HEADERS = [
+    "Inspection Date", "URL", "Verdict", "Coverage State", 
+    "Robots Txt State", "Indexing State", "Last Crawl Time", 
+    "Page Fetch State", "Google Canonical", "User Canonical"
+]
 
 # Scopes
 SCOPES = [
@@ -33,28 +74,152 @@ def get_credentials():
     print(f"Project ID: {creds_dict.get('project_id')}")
     return service_account.Credentials.from_service_account_info(creds_dict, scopes=SCOPES)
 
+_thread_local = threading.local()
+
+def get_sheets_service(creds):
+    # Service objects wrap an httplib2.Http, which is not thread-safe, so each thread builds its own
+    if not hasattr(_thread_local, 'sheets_service'):
+        _thread_local.sheets_service = build('sheets', 'v4', credentials=creds)
+    return _thread_local.sheets_service
+
+def load_cached_token(creds):
+    try:
+        with open(TOKEN_CACHE_FILE, 'r') as f:
+            cached = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return
+    
+    if cached.get('email') == creds.service_account_email:
+        creds.token = cached['token']
+        creds.expiry = datetime.fromisoformat(cached['expiry'])
+
+def save_cached_token(creds):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # The access token is a secret, so keep the file readable by the owner only
+    fd = os.open(TOKEN_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        json.dump({
+            'email': creds.service_account_email,
+            'token': creds.token,
+            'expiry': creds.expiry.isoformat()
+        }, f)
+
+def token_is_fresh(creds):
+    # google-auth keeps expiry as a naive UTC datetime
+    if not creds.valid or creds.expiry is None:
+        return False
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return creds.expiry - now >= TOKEN_MIN_LIFETIME
+
+def get_access_token(creds):
+    # Reuse a token from a previous run before paying for a fresh JWT exchange,
+    # but only if it will comfortably outlive this run
+    if not token_is_fresh(creds):
+        load_cached_token(creds)
+    if not token_is_fresh(creds):
+        creds.refresh(google.auth.transport.requests.Request())
+        try:
+            save_cached_token(creds)
+        except OSError as e:
+            print(f"Warning: could not cache access token: {e}")
+    return creds.token
+
 def generate_dynamic_urls():
-    urls = []
-    games = ['wordle', 'quordle', 'colordle', 'semantle', 'phoodle']
+    games = ('wordle', 'quordle', 'colordle', 'semantle', 'phoodle')
     today = datetime.now()
-    
-    for i in range(7):
-        date = today - timedelta(days=i)
-        # Format: january-28-2026
-        date_str = date.strftime("%B-%d-%Y").lower()
+    # Format: january-28-2026
+    dates = [(today - timedelta(days=i)).strftime("%B-%d-%Y").lower() for i in range(7)]
+    for date_str in dates:
         for game in games:
-            url = f"{SITE_URL}{game}-answer-for-{date_str}"
-            urls.append(url)
-    return urls
+            yield f"{SITE_URL}{game}-answer-for-{date_str}"
 
 def read_static_urls():
-    if not os.path.exists(PAGES_FILE):
+    try:
+        with open(PAGES_FILE, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
         print(f"Warning: {PAGES_FILE} not found.")
-        return []
+        return
+    
+    for line in data.decode('utf-8').splitlines():
+        url = line.strip()
+        if url:
+            yield url
+
+class RateLimiter:
+    """
+    Token bucket that lets at most `rate` requests start per second.
+    Fast responses proceed immediately; callers only wait once the bucket is empty.
+    The bucket always holds at least one token, so rates below 1/s still make progress.
+    """
+    def __init__(self, rate):
+        self.rate = rate
+        self.capacity = max(1, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    async def __aexit__(self, *exc):
+        return False
+
+def open_inspection_cache():
+    conn = sqlite3.connect(INSPECTION_CACHE_DB)
+    conn.execute('CREATE TABLE IF NOT EXISTS cache(url TEXT PRIMARY KEY, ts REAL, row_json TEXT)')
+    return conn
+
+def load_cached_rows(conn, urls):
+    # Returns {url: row} for every URL inspected within INSPECTION_CACHE_MAX_AGE
+    cutoff = time.time() - INSPECTION_CACHE_MAX_AGE
+    cached_rows = {}
+    for url in urls:
+        hit = conn.execute('SELECT row_json FROM cache WHERE url = ? AND ts > ?', (url, cutoff)).fetchone()
+        if hit:
+            cached_rows[url] = json.loads(hit[0])
+    return cached_rows
+
+def save_cached_row(conn, row):
+    # Failed inspections are not cached so they are retried on the next run
+    if row[2] != "ERROR":
+        conn.execute('INSERT OR REPLACE INTO cache VALUES (?, ?, ?)', (row[1], time.time(), json.dumps(row)))
+
+def open_csv_report():
+    # Ensure reports directory exists
+    reports_dir = "reports"
+    os.makedirs(reports_dir, exist_ok=True)
     
-    with open(PAGES_FILE, 'r') as f:
-        urls = [line.strip() for line in f if line.strip()]
-    return urls
+    today_str = datetime.now().strftime("%d%b-%Y").lower()
+    csv_filename = os.path.join(reports_dir, f"wordsolverx-{today_str}.csv")
+    
+    csv_file = open(csv_filename, 'w', newline='', encoding='utf-8')
+    writer = csv.writer(csv_file)
+    writer.writerow(HEADERS)
+    return csv_filename, csv_file, writer
+
+def sort_csv_report(csv_filename, all_urls):
+    # Rows were streamed in completion order for crash safety; put them back in input order
+    order = {url: i for i, url in enumerate(all_urls)}
+    with open(csv_filename, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        headers = next(reader)
+        rows = sorted(reader, key=lambda row: order.get(row[1], len(order)))
+    
+    tmp_filename = csv_filename + '.tmp'
+    with open(tmp_filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(rows)
+    os.replace(tmp_filename, csv_filename)
 
 def create_google_sheet(sheets_service):
     today_str = datetime.now().strftime("%d%b-%Y").lower()
@@ -74,17 +239,11 @@ def create_google_sheet(sheets_service):
         print(f"URL: https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit")
         
         # Initialize the sheet with headers (same as before)
-        headers = [
-            "Inspection Date", "URL", "Verdict", "Coverage State", 
-            "Robots Txt State", "Indexing State", "Last Crawl Time", 
-            "Page Fetch State", "Google Canonical", "User Canonical"
-        ]
-        
         sheets_service.spreadsheets().values().append(
             spreadsheetId=spreadsheet_id,
             range="Sheet1!A1",
             valueInputOption="RAW",
-            body={"values": [headers]}
+            body={"values": [HEADERS]}
         ).execute()
         
         return spreadsheet_id
@@ -101,33 +260,194 @@ def create_google_sheet(sheets_service):
             print("!"*50 + "\n")
         raise e
 
-def inspect_url(search_service, url, site_url):
+class InspectionError(Exception):
+    """
+    Non-2xx response from the inspect endpoint.
+    The message is Google's own error text, which is what ends up in the report's ERROR row.
+    """
+    def __init__(self, status, message):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+
+def error_message(resp):
+    # Google APIs return {"error": {"code": ..., "message": ..., "status": ...}} on failure
     try:
-        request = {
-            'inspectionUrl': url,
-            'siteUrl': site_url
-        }
-        response = search_service.urlInspection().index().inspect(body=request).execute()
-        result = response.get('inspectionResult', {})
+        return orjson.loads(resp.content)['error']['message']
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        return resp.reason_phrase
+
+def retry_delay(resp, attempt):
+    # Honor the server's Retry-After when given, otherwise back off exponentially with jitter.
+    # Either way the wait is capped, since the task holds a concurrency slot while it sleeps.
+    # resp is None when the request failed at the transport level.
+    if resp is not None:
+        try:
+            return min(MAX_RETRY_DELAY, float(resp.headers['Retry-After']))
+        except (KeyError, ValueError):
+            pass
+    return min(MAX_RETRY_DELAY, 2 ** attempt) + random.uniform(0, 1)
+
+async def fetch_inspection(client, limiter, request):
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with limiter:
+                resp = await client.post(INSPECT_ENDPOINT, params={'fields': INSPECT_FIELDS}, json=request)
+        except httpx.TransportError as e:
+            # Timeouts, dropped connections and HTTP/2 GOAWAYs are as transient as a 503
+            if attempt == MAX_RETRIES:
+                raise
+            resp, reason = None, type(e).__name__
+        else:
+            if resp.status_code not in RETRYABLE_STATUSES or attempt == MAX_RETRIES:
+                if resp.is_success:
+                    return orjson.loads(resp.content)
+                raise InspectionError(resp.status_code, error_message(resp))
+            reason = f"HTTP {resp.status_code}"
+        delay = retry_delay(resp, attempt)
+        log.warning("%s on %s, retrying in %.1fs...", reason, request['inspectionUrl'], delay)
+        await asyncio.sleep(delay)
+
+async def inspect_url(client, sem, limiter, url, site, ts):
+    async with sem:
+        log.info("Inspecting: %s", url)
+        try:
+            site_url = site.url
+            try:
+                response = await fetch_inspection(client, limiter, {'inspectionUrl': url, 'siteUrl': site_url})
+            except InspectionError as e:
+                # A stale cached property refuses every URL, so look it up again and retry once
+                new_site_url = await site.reresolve(site_url) if e.status == 403 else None
+                if not new_site_url:
+                    raise
+                response = await fetch_inspection(client, limiter, {'inspectionUrl': url, 'siteUrl': new_site_url})
+            result = response.get('inspectionResult', {})
+            
+            index_result = result.get('indexStatusResult', {})
+            
+            row = [
+                ts,
+                url,
+                index_result.get('verdict', 'N/A'),
+                index_result.get('coverageState', 'N/A'),
+                index_result.get('robotsTxtState', 'N/A'),
+                index_result.get('indexingState', 'N/A'),
+                index_result.get('lastCrawlTime', 'N/A'),
+                index_result.get('pageFetchState', 'N/A'),
+                index_result.get('googleCanonical', 'N/A'),
+                index_result.get('userCanonical', 'N/A')
+            ]
+            return row
+        except Exception as e:
+            log.warning("Error inspecting %s: %s", url, e)
+            return [ts, url, "ERROR", str(e), "", "", "", "", "", ""]
+
+async def inspect_all(creds, indexed_urls, site, on_row):
+    """
+    Inspects (index, url) pairs concurrently, multiplexed over a single HTTP/2 connection.
+    Rows are handed to on_row(index, row) in completion order, so a slow inspection never
+    holds up the others; the index lets the caller restore the input order afterwards.
+    """
+    headers = {"Authorization": f"Bearer {get_access_token(creds)}"}
+    # Keep the connection alive for the whole run so the TLS handshake is paid once, not per URL
+    limits = httpx.Limits(max_connections=MAX_CONCURRENCY, keepalive_expiry=60)
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    limiter = RateLimiter(MAX_QPS)
+    # One timestamp for the whole run rather than formatting the clock for every row
+    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    timeout = httpx.Timeout(REQUEST_TIMEOUT)
+    async with httpx.AsyncClient(http2=True, headers=headers, limits=limits, timeout=timeout) as client:
+        async def inspect_indexed(i, url):
+            return i, await inspect_url(client, sem, limiter, url, site, ts)
         
-        index_result = result.get('indexStatusResult', {})
+        tasks = [asyncio.create_task(inspect_indexed(i, url)) for i, url in indexed_urls]
+        for fut in asyncio.as_completed(tasks):
+            i, row = await fut
+            on_row(i, row)
+
+async def inspect_and_report(creds, all_urls, site, cache, cacheable_urls, cached_rows):
+    """
+    Inspects all URLs and saves the rows to a new Google Sheet, falling back to a CSV report.
+    URLs found in cached_rows are reported from the cache instead of being inspected again,
+    and fresh results for cacheable_urls are stored for the next run.
+    The spreadsheet is created in a worker thread while the first inspections are already running;
+    rows that complete before we know where they go are held in memory.
+    Returns the CSV path if the fallback was used, otherwise None.
+    """
+    pending_rows = []  # (index, row) pairs
+    csv_filename = None
+    csv_file = None
+    writer = None
+
+    def fall_back_to_csv():
+        # Flush everything buffered so far, then stream the remaining rows straight to disk
+        nonlocal csv_filename, csv_file, writer
+        csv_filename, csv_file, writer = open_csv_report()
+        pending_rows.sort()
+        writer.writerows(row for _, row in pending_rows)
+        csv_file.flush()
+        pending_rows.clear()
+
+    def on_row(i, row):
+        if writer:
+            writer.writerow(row)
+            csv_file.flush()
+        else:
+            pending_rows.append((i, row))
+
+    def on_inspected(i, row):
+        if row[1] in cacheable_urls:
+            save_cached_row(cache, row)
+        on_row(i, row)
+
+    async def create_sheet():
+        try:
+            return await asyncio.to_thread(lambda: create_google_sheet(get_sheets_service(creds)))
+        except Exception as e:
+            print(f"\n[WARNING] Google Sheets creation failed: {e}")
+            print("Falling back to CSV creation...\n")
+            fall_back_to_csv()
+            return None
+
+    urls_to_inspect = []
+    for i, url in enumerate(all_urls):
+        if url in cached_rows:
+            on_row(i, cached_rows[url])
+        else:
+            urls_to_inspect.append((i, url))
+
+    try:
+        spreadsheet_id, _ = await asyncio.gather(
+            create_sheet(),
+            inspect_all(creds, urls_to_inspect, site, on_row=on_inspected)
+        )
         
-        row = [
-            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            url,
-            index_result.get('verdict', 'N/A'),
-            index_result.get('coverageState', 'N/A'),
-            index_result.get('robotsTxtState', 'N/A'),
-            index_result.get('indexingState', 'N/A'),
-            index_result.get('lastCrawlTime', 'N/A'),
-            index_result.get('pageFetchState', 'N/A'),
-            index_result.get('googleCanonical', 'N/A'),
-            index_result.get('userCanonical', 'N/A')
-        ]
-        return row
-    except Exception as e:
-        print(f"Error inspecting {url}: {e}")
-        return [datetime.now().strftime("%Y-%m-%d %H:%M:%S"), url, "ERROR", str(e), "", "", "", "", "", ""]
+        if spreadsheet_id:
+            pending_rows.sort()
+            all_rows = [row for _, row in pending_rows]
+            for i in range(0, len(all_rows), SHEETS_APPEND_CHUNK):
+                chunk_rows = all_rows[i:i+SHEETS_APPEND_CHUNK]
+                try:
+                    get_sheets_service(creds).spreadsheets().values().append(
+                        spreadsheetId=spreadsheet_id,
+                        range="Sheet1!A2",
+                        valueInputOption="RAW",
+                        body={"values": chunk_rows}
+                    ).execute()
+                    print(f"Appended {len(chunk_rows)} rows to Google Sheet.")
+                except Exception as e:
+                    print(f"Failed to append to Google Sheet: {e}. Switching to CSV fallback.")
+                    fall_back_to_csv()
+                    break
+    finally:
+        cache.commit()
+        if csv_file:
+            csv_file.close()
+    
+    if csv_filename:
+        sort_csv_report(csv_filename, all_urls)
+    
+    return csv_filename
 
 def find_verified_property(service):
     """
@@ -157,27 +477,130 @@ def find_verified_property(service):
         print(f"Error listing sites: {e}")
         return None
 
+def load_cached_site_url(creds):
+    try:
+        with open(SITE_URL_CACHE_FILE, 'r') as f:
+            cached = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    
+    if cached.get('email') != creds.service_account_email:
+        return None
+    if time.time() - cached.get('verified_at', 0) > SITE_URL_CACHE_MAX_AGE:
+        return None
+    return cached.get('site_url')
+
+def save_cached_site_url(creds, site_url):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(SITE_URL_CACHE_FILE, 'w') as f:
+            json.dump({
+                'email': creds.service_account_email,
+                'site_url': site_url,
+                'verified_at': time.time()
+            }, f)
+    except OSError as e:
+        print(f"Warning: could not cache GSC property: {e}")
+
+def invalidate_site_url_cache():
+    try:
+        os.remove(SITE_URL_CACHE_FILE)
+    except FileNotFoundError:
+        pass
+
+def resolve_site_url(service, creds):
+    """
+    Returns (site_url, from_cache) for the verified GSC property, reusing last week's
+    answer when available so most runs skip the sites().list() call.
+    """
+    site_url = load_cached_site_url(creds)
+    if site_url:
+        print(f"Using cached GSC property for {creds.service_account_email}")
+        return site_url, True
+    
+    site_url = find_verified_property(service)
+    if site_url:
+        save_cached_site_url(creds, site_url)
+    return site_url, False
+
+def refresh_site_url(service, creds):
+    invalidate_site_url_cache()
+    site_url = find_verified_property(service)
+    if site_url:
+        save_cached_site_url(creds, site_url)
+    return site_url
+
+class SiteProperty:
+    """
+    The GSC property URLs are inspected against.
+    If it came from the cache, it is looked up again (at most once per run) the first time
+    an inspection is refused with 403, so a stale cache doesn't cost the whole day's report.
+    """
+    def __init__(self, service, creds, url, from_cache):
+        self.service = service
+        self.creds = creds
+        self.url = url
+        self.from_cache = from_cache
+        self.lock = asyncio.Lock()
+
+    async def reresolve(self, stale_url):
+        """Returns a different property to retry with, or None if there is nothing better."""
+        async with self.lock:
+            if self.url != stale_url:
+                # Another inspection already replaced it
+                return self.url
+            if not self.from_cache:
+                return None
+            
+            self.from_cache = False
+            print(f"GSC refused the cached property {stale_url}, looking it up again...")
+            # sites().list() is a blocking call; run it off the loop so in-flight inspections keep going.
+            # The lock keeps this the only user of the search service while it runs.
+            site_url = await asyncio.to_thread(refresh_site_url, self.service, self.creds)
+            if not site_url or site_url == stale_url:
+                return None
+            self.url = site_url
+            return site_url
+
+def parse_log_level(value):
+    # Accepts level names (any case) or numeric levels; returns None for anything else
+    value = value.strip().upper()
+    if value.isdigit():
+        return int(value)
+    level = logging.getLevelName(value)
+    return level if isinstance(level, int) else None
+
 def main():
+    # Per-URL progress goes through logging so CI can silence it with LOGLEVEL=WARNING
+    log_level_env = os.environ.get('LOGLEVEL', 'INFO')
+    log_level = parse_log_level(log_level_env)
+    logging.basicConfig(level=logging.INFO if log_level is None else log_level, format='%(asctime)s %(levelname)s %(message)s')
+    if log_level is None:
+        log.warning("Unknown LOGLEVEL %r, using INFO", log_level_env)
     print("Starting URL Inspection script...")
     dry_run = os.environ.get('DRY_RUN', 'false').lower() == 'true'
+    force = os.environ.get('FORCE', 'false').lower() == 'true'
     
     try:
         creds = get_credentials()
+        # Should be google.auth.crypt._cryptography_rsa; the pure-Python signer is much slower
+        log.debug("JWT signer: %s", google.auth.crypt.RSASigner.__module__)
+        get_access_token(creds)
         search_service = build('searchconsole', 'v1', credentials=creds)
-        sheets_service = build('sheets', 'v4', credentials=creds)
         
         # 0. Find Correct Site URL
         print("Verifying GSC Access...")
-        site_url = find_verified_property(search_service)
+        site_url, from_cache = resolve_site_url(search_service, creds)
         if not site_url:
             print("Aborting: No access to wordsolverx.com property found.")
             return
         print(f"Using GSC Property: {site_url}\n")
         
         # 1. Generate URLs
-        static_urls = read_static_urls()
-        dynamic_urls = generate_dynamic_urls()
-        all_urls = static_urls + dynamic_urls
+        # Drop duplicates (e.g. a dated URL also listed in pages.txt) while keeping the original order
+        static_urls = list(read_static_urls())
+        dynamic_urls = list(generate_dynamic_urls())
+        all_urls = list(dict.fromkeys(itertools.chain(static_urls, dynamic_urls)))
         print(f"Total URLs to inspect: {len(all_urls)}")
         
         if not all_urls:
@@ -191,64 +614,23 @@ def main():
             print("Dry run complete. No API calls made to GSC or Sheets.")
             return
 
-        # 2. Try to Create Spreadsheet
-        spreadsheet_id = None
-        csv_mode = False
-        try:
-            spreadsheet_id = create_google_sheet(sheets_service)
-        except Exception as e:
-            print(f"\n[WARNING] Google Sheets creation failed: {e}")
-            print("Falling back to CSV creation...\n")
-            csv_mode = True
+        # 2. Reuse results from the last 24h for pages.txt entries unless FORCE is set.
+        # Dated pages are published daily and their status changes within hours, so they are always inspected live.
+        cacheable_urls = set(static_urls).difference(dynamic_urls)
+        cache = open_inspection_cache()
+        cached_rows = {} if force else load_cached_rows(cache, cacheable_urls)
         
-        # 3. Inspect URLs
-        all_rows = []
-        headers = [
-            "Inspection Date", "URL", "Verdict", "Coverage State", 
-            "Robots Txt State", "Indexing State", "Last Crawl Time", 
-            "Page Fetch State", "Google Canonical", "User Canonical"
-        ]
-        
-        batch_size = 5
-        for i in range(0, len(all_urls), batch_size):
-            batch = all_urls[i:i+batch_size]
-            batch_rows = []
-            for url in batch:
-                print(f"Inspecting: {url}")
-                row = inspect_url(search_service, url, site_url)
-                batch_rows.append(row)
-                all_rows.append(row)
-                time.sleep(1) 
-            
-            if not csv_mode and spreadsheet_id:
-                try:
-                    sheets_service.spreadsheets().values().append(
-                        spreadsheetId=spreadsheet_id,
-                        range="Sheet1!A2",
-                        valueInputOption="RAW",
-                        body={"values": batch_rows}
-                    ).execute()
-                    print(f"Appended {len(batch_rows)} rows to Google Sheet.")
-                except Exception as e:
-                    print(f"Failed to append to Google Sheet: {e}. Switching to CSV fallback for remaining rows.")
-                    csv_mode = True
-            
-        # 4. Final CSV Export if in CSV mode
-        if csv_mode:
-            import csv
-            
-            # Ensure reports directory exists
-            reports_dir = "reports"
-            if not os.path.exists(reports_dir):
-                os.makedirs(reports_dir)
-                
-            today_str = datetime.now().strftime("%d%b-%Y").lower()
-            csv_filename = os.path.join(reports_dir, f"wordsolverx-{today_str}.csv")
+        # 3. Create the spreadsheet and inspect URLs concurrently
+        site = SiteProperty(search_service, creds, site_url, from_cache)
+        try:
+            csv_filename = asyncio.run(inspect_and_report(creds, all_urls, site, cache, cacheable_urls, cached_rows))
+        finally:
+            cache.close()
+        if cacheable_urls:
+            print(f"Cache hits: {len(cached_rows)}/{len(cacheable_urls)} static URLs ({len(cached_rows) / len(cacheable_urls):.0%})")
             
-            with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
-                writer.writerows(all_rows)
+        # 4. Report where the results went
+        if csv_filename:
             print(f"\nSuccess! Results saved to local file: {csv_filename}")
         else:
             print("\nSuccess! Results saved to Google Sheets.")